@@ -1,59 +1,108 @@
 #!/usr/bin/env python3
 
 import os           # для работы с операционной системой
+import re           # для разбора /proc/meminfo регулярным выражением
+import sys          # для вывода результата одной операцией записи
 import platform     # для получения информации о платформе
-import getpass      # для получения имени текущего пользователя
-import subprocess   # для запуска внешних команд
-from pathlib import Path  # для удобной работы с путями файлов
+import pwd          # для получения имени пользователя из базы учетных записей
+from functools import lru_cache  # для кэширования неизменяемых данных
+from collections import namedtuple  # для компактных записей о дисках
+from concurrent.futures import ThreadPoolExecutor  # для параллельных вызовов statvfs
 
+# Единицы измерения в байтах
+KB = 1 << 10
+MB = 1 << 20
+GB = 1 << 30
 
+# Информация о диске: точка монтирования, тип ФС, общий размер и свободное место в GB
+Drive = namedtuple('Drive', ('mount_point', 'fs_type', 'total_gb', 'free_gb'))
+
+# Специальные файловые системы (виртуальные, системные), которые не показываем
+SPECIAL_FS = frozenset({
+    'proc', 'sysfs', 'devtmpfs', 'devpts', 'tmpfs', 'cgroup',
+    'securityfs', 'configfs', 'debugfs', 'tracefs', 'pstore',
+    'efivarfs', 'mqueue', 'hugetlbfs', 'fusectl', 'fuse.gvfsd-fuse',
+    'autofs', 'binfmt_misc', 'nsfs', 'bpf', 'iso9660'
+})
+
+# Префиксы виртуальных и оптических (/dev/sr*) устройств, для которых statvfs не вызываем
+SKIP_DEVICE_PREFIXES = ('/dev/loop', 'udev', 'none', '/dev/sr')
+
+# Строка /proc/meminfo вида "MemTotal:       16384 kB" -> (b'MemTotal', b'16384')
+MEMINFO_RE = re.compile(rb'^([^:\n]+):\s+(\d+)', re.M)
+
+# Файлы с описанием дистрибутива в порядке предпочтения
+RELEASE_FILES = ('/etc/os-release', '/etc/lsb-release', '/etc/system-release')
+
+
+def parse_kv(text, sep):
+    """Разбор строк вида "ключ<sep>значение", строки без разделителя пропускаются"""
+    for line in text.splitlines():
+        key, found, value = line.partition(sep)
+        if found:
+            yield key.strip(), value.strip().strip('"')  # Убираем пробелы и кавычки вокруг значений
+
+
+@lru_cache(maxsize=1)
 def get_os_info():
-    """Получение информации о дистрибутиве Linux"""
-    try:
-        # Пробуем прочитать /etc/os-release - стандартный файл с информацией о дистрибутиве
-        if Path('/etc/os-release').exists():
-            with open('/etc/os-release', 'r') as f:
-                content = f.read()
-
-            os_info = {}
-            # Парсим файл построчно
-            for line in content.split('\n'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    value = value.strip('"')  # Убираем кавычки вокруг значений
-                    os_info[key] = value
-
-            # Сначала пытаемся получить красивое имя
-            if 'PRETTY_NAME' in os_info:
-                return os_info['PRETTY_NAME']
-            # Если нет, то комбинируем имя и версию
-            elif 'NAME' in os_info and 'VERSION' in os_info:
-                return f"{os_info['NAME']} {os_info['VERSION']}"
-
-        # Запасной вариант: используем команду lsb_release
-        result = subprocess.run(['lsb_release', '-d'], capture_output=True, text=True)
-        if result.returncode == 0:
-            # Извлекаем описание из вывода команды
-            return result.stdout.split(':', 1)[1].strip()
-    except Exception:
-        # В случае любой ошибки возвращаем "Unknown"
-        pass
+    """Получение информации о дистрибутиве Linux (не меняется за время работы, поэтому кэшируется)"""
+    for path in RELEASE_FILES:
+        try:
+            content = read_file(path).decode('utf-8', 'replace')
+        except OSError:
+            continue  # Файла нет или он недоступен - пробуем следующий
+
+        os_info = dict(parse_kv(content, '='))
+
+        # Сначала пытаемся получить красивое имя (os-release / lsb-release)
+        if 'PRETTY_NAME' in os_info:
+            return os_info['PRETTY_NAME']
+        if 'DISTRIB_DESCRIPTION' in os_info:
+            return os_info['DISTRIB_DESCRIPTION']
+        # Если нет, то комбинируем имя и версию
+        if 'NAME' in os_info and 'VERSION' in os_info:
+            return f"{os_info['NAME']} {os_info['VERSION']}"
+        # system-release содержит просто строку вида "Fedora release 38"
+        if not os_info and content.strip():
+            return content.strip().split('\n', 1)[0]
 
     return "Unknown"
 
 
+@lru_cache(maxsize=1)
+def get_username():
+    """Получение имени текущего пользователя (не меняется за время работы, поэтому кэшируется)"""
+    # Сначала берем имя из переменных окружения, чтобы не обращаться к NSS
+    # (/etc/passwd, LDAP, SSSD), и только при их отсутствии ищем по uid
+    username = os.environ.get('USER') or os.environ.get('LOGNAME')
+    if username:
+        return username
+    try:
+        return pwd.getpwuid(os.getuid()).pw_name
+    except KeyError:
+        # Для uid нет записи в базе учетных записей
+        return "Unknown"
+
+
+def read_file(path, size=8192):
+    """Чтение небольшого файла (/proc, /etc) одним системным вызовом read()"""
+    # Ядро генерирует содержимое /proc заново при каждом чтении, поэтому читаем
+    # весь файл за один раз, без буферизованного файлового объекта
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
 def get_memory_info():
-    """Получение информации о памяти из /proc/meminfo"""
+    """Получение информации о памяти из /proc/meminfo (ключи - bytes, например b'MemTotal')"""
     mem_info = {}
     try:
-        # Читаем виртуальный файл /proc/meminfo с информацией о памяти
-        with open('/proc/meminfo', 'r') as f:
-            for line in f:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    # Извлекаем числовое значение (убираем ' kB')
-                    num_value = value.strip().split()[0]
-                    mem_info[key.strip()] = int(num_value)  # Сохраняем как число
+        # Читаем виртуальный файл /proc/meminfo с информацией о памяти и разбираем
+        # его как bytes одним проходом регулярного выражения: int() принимает bytes напрямую
+        content = read_file('/proc/meminfo', 8192)
+        mem_info = {key: int(value) for key, value in MEMINFO_RE.findall(content)}
     except Exception:
         # Если файл недоступен, возвращаем пустой словарь
         pass
@@ -64,19 +113,26 @@ def get_memory_info():
 def get_load_average():
     """Получение средней загрузки системы за 1, 5 и 15 минут"""
     try:
-        # Читаем файл /proc/loadavg с информацией о загрузке системы
-        with open('/proc/loadavg', 'r') as f:
-            load_avg = f.read().strip().split()
-            # Возвращаем первые три значения (1, 5, 15 минут)
-            return [float(x) for x in load_avg[:3]]
-    except Exception:
+        # os.getloadavg() вызывает getloadavg(3) из libc без чтения /proc/loadavg
+        return list(os.getloadavg())
+    except (OSError, AttributeError):
         # В случае ошибки возвращаем нулевые значения
         return [0.0, 0.0, 0.0]
 
 
+def safe_statvfs(mount_point):
+    """Вызов os.statvfs, возвращающий None вместо исключения"""
+    try:
+        return os.statvfs(mount_point)
+    except OSError:
+        return None
+
+
 def get_disk_info():
     """Получение информации о подключенных дисках и их использовании"""
     drives = []
+    mounts = []
+    seen = set()  # Уже учтенные пары (устройство, тип ФС)
     try:
         # Читаем файл /proc/mounts со списком смонтированных файловых систем
         with open('/proc/mounts', 'r') as f:
@@ -86,70 +142,62 @@ def get_disk_info():
                     # Разбираем строку на компоненты
                     device, mount_point, fs_type, options = parts[0], parts[1], parts[2], parts[3]
 
-                    # Пропускаем специальные файловые системы (виртуальные, системные)
-                    special_fs = [
-                        'proc', 'sysfs', 'devtmpfs', 'devpts', 'tmpfs', 'cgroup',
-                        'securityfs', 'configfs', 'debugfs', 'tracefs', 'pstore',
-                        'efivarfs', 'mqueue', 'hugetlbfs', 'fusectl', 'fuse.gvfsd-fuse',
-                        'autofs', 'binfmt_misc', 'nsfs', 'bpf', 'iso9660'
-                    ]
-
-                    if fs_type in special_fs:
-                        continue  # Пропускаем специальные ФС
-
-                    # Пропускаем виртуальные устройства
-                    if device.startswith(('/dev/loop', 'udev', 'none')):
+                    # Пропускаем специальные ФС и виртуальные/оптические устройства
+                    if fs_type in SPECIAL_FS or device.startswith(SKIP_DEVICE_PREFIXES):
                         continue
 
-                    try:
-                        # Получаем статистику файловой системы
-                        stat = os.statvfs(mount_point)
-                        # Вычисляем общий размер в GB
-                        total_gb = (stat.f_blocks * stat.f_frsize) / (1024 ** 3)
-                        # Вычисляем свободное место в GB
-                        free_gb = (stat.f_bfree * stat.f_frsize) / (1024 ** 3)
-
-                        # Пропускаем диски с нулевым размером или меньше 0.1GB
-                        if total_gb < 0.1:
-                            continue
-
-                        # Добавляем информацию о диске в список
-                        drives.append({
-                            'mount_point': mount_point,  # Точка монтирования
-                            'fs_type': fs_type,          # Тип файловой системы
-                            'total_gb': round(total_gb, 1),  # Общий размер
-                            'free_gb': round(free_gb, 1)     # Свободное место
-                        })
-                    except Exception:
-                        # Если не удалось получить статистику, пропускаем этот диск
+                    # Bind-монтирования одного устройства дают одинаковую статистику,
+                    # поэтому оставляем только первую точку монтирования
+                    if (device, fs_type) in seen:
                         continue
+                    seen.add((device, fs_type))
+
+                    mounts.append((device, mount_point, fs_type))
     except Exception:
         # Если не удалось прочитать /proc/mounts, возвращаем пустой список
-        pass
+        return drives
+
+    if not mounts:
+        return drives
+
+    # Запрашиваем статистику всех ФС параллельно: os.statvfs отпускает GIL,
+    # поэтому медленная (например, сетевая) ФС не задерживает остальные
+    with ThreadPoolExecutor(max_workers=min(32, len(mounts))) as executor:
+        stats = list(executor.map(safe_statvfs, [mount[1] for mount in mounts]))
+
+    for (device, mount_point, fs_type), stat in zip(mounts, stats):
+        if stat is None:
+            # Если не удалось получить статистику, пропускаем этот диск
+            continue
+
+        # Вычисляем общий размер и свободное место в байтах
+        total_bytes = stat.f_blocks * stat.f_frsize
+        free_bytes = stat.f_bfree * stat.f_frsize
+
+        # Пропускаем диски с нулевым размером или меньше 0.1GB
+        if total_bytes < GB / 10:
+            continue
+
+        # Добавляем информацию о диске в список
+        drives.append(Drive(mount_point, fs_type, round(total_bytes / GB, 1), round(free_bytes / GB, 1)))
 
     return drives
 
 
-def get_swap_info():
-    """Получение информации о swap-памяти"""
+def get_swap_info(mem_info):
+    """Получение информации о swap-памяти (mem_info - уже прочитанный /proc/meminfo)"""
     try:
         # Читаем файл /proc/swaps с информацией о swap-разделах
-        with open('/proc/swaps', 'r') as f:
-            lines = f.readlines()[1:]  # Пропускаем первую строку (заголовок)
-            total_swap = 0
-            free_swap = 0
+        # Отделяем первую строку (заголовок) без копирования списка строк
+        _, _, body = read_file('/proc/swaps', 8192).partition(b'\n')
 
-            # Суммируем размер всех swap-разделов
-            for line in lines:
-                parts = line.split()
-                if len(parts) >= 4:
-                    total_swap += int(parts[2])  # Размер в килобайтах (третий столбец)
+        # Суммируем размер всех swap-разделов (третий столбец, в килобайтах)
+        total_swap = sum(int(parts[2]) for parts in map(bytes.split, body.splitlines()) if len(parts) >= 4)
 
-            # Получаем информацию о свободной swap-памяти из meminfo
-            mem_info = get_memory_info()
-            free_swap = mem_info.get('SwapFree', 0)
+        # Берем информацию о свободной swap-памяти из уже прочитанного meminfo
+        free_swap = mem_info.get(b'SwapFree', 0)
 
-            return total_swap, free_swap
+        return total_swap, free_swap
     except Exception:
         # Если файл недоступен, возвращаем нулевые значения
         return 0, 0
@@ -161,79 +209,88 @@ def main():
     uname = platform.uname()      # Информация о системе через uname
     mem_info = get_memory_info()  # Информация о памяти
     load_avg = get_load_average() # Средняя загрузка системы
+    out = []  # Строки вывода, которые печатаются одной записью в конце
 
     # Выводим информацию об ОС и дистрибутиве
     os_info = get_os_info()
-    print(f"OS: {os_info}")
+    out.append(f"OS: {os_info}")
 
     # Выводим информацию о ядре Linux
-    print(f"Kernel: {uname.system} {uname.release}")
+    out.append(f"Kernel: {uname.system} {uname.release}")
 
     # Выводим архитектуру процессора
-    print(f"Architecture: {uname.machine}")
+    out.append(f"Architecture: {uname.machine}")
 
     # Выводим имя хоста (компьютера)
-    print(f"Hostname: {uname.node}")
+    out.append(f"Hostname: {uname.node}")
 
     # Выводим имя текущего пользователя
-    print(f"User: {getpass.getuser()}")
+    out.append(f"User: {get_username()}")
 
-    # Выводим информацию об оперативной памяти (в МБ)
-    mem_total = mem_info.get('MemTotal', 0)
-    mem_available = mem_info.get('MemAvailable', mem_info.get('MemFree', 0))
+    # Все нужные значения из /proc/meminfo (в KB) получаем за один проход
+    mem_total, mem_available, mem_free, vmalloc_total = (
+        mem_info.get(key, 0) for key in (b'MemTotal', b'MemAvailable', b'MemFree', b'VmallocTotal'))
+    # В старых ядрах нет MemAvailable - используем MemFree
+    mem_available = mem_available or mem_free
 
-    if mem_total > 0:
-        # Конвертируем из KB в MB (делим на 1024)
-        print(f"RAM: {mem_available // 1024}MB free / {mem_total // 1024}MB total")
-    else:
+    if mem_total == 0:
         # Fallback: используем psutil если /proc/meminfo недоступен
         try:
             import psutil
             memory = psutil.virtual_memory()
-            # Конвертируем из байт в MB (делим на 1024^2)
-            print(f"RAM: {memory.available // (1024 ** 2)}MB free / {memory.total // (1024 ** 2)}MB total")
+            # Конвертируем из байт в KB, чтобы вывод ниже был общим
+            mem_total, mem_available = memory.total // KB, memory.available // KB
         except ImportError:
-            print("RAM: Information not available")
+            pass
+
+    # Выводим информацию об оперативной памяти (в МБ)
+    if mem_total > 0:
+        # Конвертируем из KB в MB (делим на 1024)
+        out.append(f"RAM: {mem_available // KB}MB free / {mem_total // KB}MB total")
+    else:
+        out.append("RAM: Information not available")
 
     # Выводим информацию о swap-памяти
-    swap_total, swap_free = get_swap_info()
+    swap_total, swap_free = get_swap_info(mem_info)
     if swap_total > 0:
-        print(f"Swap: {swap_total // 1024}MB total / {swap_free // 1024}MB free")
+        out.append(f"Swap: {swap_total // KB}MB total / {swap_free // KB}MB free")
     else:
         try:
             import psutil
             swap = psutil.swap_memory()
-            print(f"Swap: {swap.total // (1024 ** 2)}MB total / {swap.free // (1024 ** 2)}MB free")
+            out.append(f"Swap: {swap.total // MB}MB total / {swap.free // MB}MB free")
         except ImportError:
-            print("Swap: Information not available")
+            out.append("Swap: Information not available")
 
     # Выводим информацию о виртуальной памяти
-    vmalloc_total = mem_info.get('VmallocTotal', 0)
     if vmalloc_total > 0:
-        print(f"Virtual memory: {vmalloc_total // 1024} MB")
+        out.append(f"Virtual memory: {vmalloc_total // KB} MB")
     else:
-        print("Virtual memory: information not available")
+        out.append("Virtual memory: information not available")
 
     # Выводим количество логических процессоров
     try:
         processors = os.cpu_count()
-        print(f"Processors: {processors}")
+        out.append(f"Processors: {processors}")
     except Exception:
-        print("Processors: Information not available")
+        out.append("Processors: Information not available")
 
     # Выводим среднюю загрузку системы за 1, 5 и 15 минут
-    print(f"Load average: {load_avg[0]:.2f}, {load_avg[1]:.2f}, {load_avg[2]:.2f}")
+    out.append(f"Load average: {load_avg[0]:.2f}, {load_avg[1]:.2f}, {load_avg[2]:.2f}")
 
     # Выводим информацию о подключенных дисках
     drives = get_disk_info()
-    print("Drives:")
+    out.append("Drives:")
     if drives:
         for drive in drives:
             # Форматируем вывод для каждого диска
-            print(
-                f"  {drive['mount_point']:10} {drive['fs_type']:8} {drive['free_gb']}GB free / {drive['total_gb']}GB total")
+            out.append(
+                f"  {drive.mount_point:10} {drive.fs_type:8} {drive.free_gb}GB free / {drive.total_gb}GB total")
     else:
-        print("  No drives found")
+        out.append("  No drives found")
+
+    # Выводим все собранные строки одним вызовом write
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":
@@ -2,12 +2,25 @@ import platform
 import socket
 import psutil
 import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+# Единицы измерения в байтах
+MB = 1 << 20
+GB = 1 << 30
 
+# Информация о логическом диске: буква, файловая система, общий размер и свободное место в ГБ
+Drive = namedtuple('Drive', ('drive', 'fs_type', 'total_gb', 'free_gb'))
+
+
+@lru_cache(maxsize=1)
 def get_windows_version():
     """
     Получение информации о версии Windows
     Использует комбинацию platform и проверку версий
+    Версия не меняется за время работы программы, поэтому результат кэшируется
     """
     try:
         # Проверяем, что система действительно Windows
@@ -23,13 +36,8 @@ def get_windows_version():
                 'vista': 'Windows Vista'
             }
 
-            # Ищем соответствие в словаре версий
-            for key, value in version_map.items():
-                if key in release.lower():
-                    return value
-
-            # Если не нашли в словаре, возвращаем сырую информацию
-            return f"Windows {release} ({version})"
+            # Ищем точное соответствие в словаре версий, иначе возвращаем сырую информацию
+            return version_map.get(release.lower(), f"Windows {release} ({version})")
         return "Not Windows"  # Если система не Windows
     except (OSError, ValueError, AttributeError) as e:
         # Обработка конкретных ошибок с выводом информации об ошибке
@@ -60,16 +68,34 @@ def get_processor_architecture():
         return "Unknown"
 
 
-def get_memory_info():
+def query_memory():
+    """
+    Однократный запрос информации о физической памяти и файле подкачки
+    Каждый вызов psutil обращается к WinAPI, поэтому результаты переиспользуются
+    """
+    try:
+        memory = psutil.virtual_memory()  # Физическая память
+    except (OSError, AttributeError, NotImplementedError) as e:
+        print(f"Error getting memory info: {e}")
+        memory = None
+    try:
+        swap = psutil.swap_memory()  # Файл подкачки
+    except (OSError, AttributeError, NotImplementedError) as e:
+        print(f"Error getting pagefile info: {e}")
+        swap = None
+    return memory, swap
+
+
+def get_memory_info(memory):
     """
     Получение информации о физической памяти (RAM)
-    Использует psutil для кросс-платформенности и простоты
+    memory - результат psutil.virtual_memory(), полученный один раз в main()
     """
+    if memory is None:
+        return 0, 0, 0
     try:
-        # psutil.virtual_memory() возвращает именованный кортеж с информацией о памяти
-        memory = psutil.virtual_memory()
-        total_phys_mb = memory.total // (1024 * 1024)  # Конвертируем байты в мегабайты
-        avail_phys_mb = memory.available // (1024 * 1024)  # Доступная память
+        total_phys_mb = memory.total // MB  # Конвертируем байты в мегабайты
+        avail_phys_mb = memory.available // MB  # Доступная память
         memory_load = memory.percent  # Процент использования памяти (0-100)
 
         return total_phys_mb, avail_phys_mb, memory_load
@@ -78,16 +104,17 @@ def get_memory_info():
         return 0, 0, 0  # Возвращаем нули при ошибке
 
 
-def get_pagefile_info():
+def get_pagefile_info(swap):
     """
     Получение информации о файле подкачки (swap memory)
     Файл подкачки - это виртуальная память на диске
+    swap - результат psutil.swap_memory(), полученный один раз в main()
     """
+    if swap is None:
+        return 0, 0
     try:
-        # psutil.swap_memory() возвращает информацию о swap-файле
-        swap = psutil.swap_memory()
-        used_mb = swap.used // (1024 * 1024)  # Используемый swap в МБ
-        total_mb = swap.total // (1024 * 1024)  # Общий размер swap в МБ
+        used_mb = swap.used // MB  # Используемый swap в МБ
+        total_mb = swap.total // MB  # Общий размер swap в МБ
         return used_mb, total_mb
     except (OSError, AttributeError, NotImplementedError) as e:
         print(f"Error getting pagefile info: {e}")
@@ -107,56 +134,54 @@ def get_processor_count():
             return 0  # Если все методы не сработали
 
 
+def safe_disk_usage(partition):
+    """
+    Получение информации об использовании диска без выброса исключений
+    Возвращает пару (usage, error), где один из элементов равен None
+    """
+    try:
+        return psutil.disk_usage(partition.mountpoint), None
+    except (OSError, PermissionError, FileNotFoundError) as e:
+        return None, e
+
+
 def get_drives_info():
     """
     Получение информации о всех логических дисках системы
-    Возвращает список словарей с информацией о каждом диске
+    Возвращает список записей Drive с информацией о каждом диске
     """
     drives = []  # Создаем пустой список для хранения информации о дисках
     try:
         # psutil.disk_partitions() возвращает список всех разделов диска
-        for partition in psutil.disk_partitions():
-            # Пропускаем CD-ROM и пустые устройства
-            if 'cdrom' in partition.opts or not partition.device:
-                continue
-
-            try:
-                # Получаем информацию об использовании диска
-                usage = psutil.disk_usage(partition.mountpoint)
-                total_gb = usage.total // (1024 ** 3)  # Конвертируем в гигабайты
-                free_gb = usage.free // (1024 ** 3)  # Свободное место в ГБ
-
-                # Добавляем информацию о диске в список
-                drives.append({
-                    'drive': partition.device,  # Буква диска (C:\, D:\)
-                    'fs_type': partition.fstype,  # Файловая система (NTFS, FAT32)
-                    'total_gb': total_gb,  # Общий размер
-                    'free_gb': free_gb  # Свободное место
-                })
-            except (OSError, PermissionError, FileNotFoundError) as e:
-                # Если не удалось прочитать диск (например, нет прав доступа)
-                print(f"Error reading drive {partition.device}: {e}")
-                continue  # Переходим к следующему диску
-
+        # Пропускаем CD-ROM и пустые устройства
+        partitions = [partition for partition in psutil.disk_partitions()
+                      if 'cdrom' not in partition.opts and partition.device]
     except (OSError, AttributeError) as e:
         print(f"Error getting drives info: {e}")
+        return drives
 
-    return drives  # Возвращаем список дисков
+    if not partitions:
+        return drives
 
+    # Опрашиваем диски параллельно: сетевые и "уснувшие" USB-диски могут
+    # отвечать секундами и не должны задерживать остальные
+    with ThreadPoolExecutor(max_workers=min(8, len(partitions))) as executor:
+        results = list(executor.map(safe_disk_usage, partitions))
 
-def get_virtual_memory_size():
-    """
-    Расчет общего размера виртуальной памяти
-    Виртуальная память = физическая память + файл подкачки
-    """
-    try:
-        memory = psutil.virtual_memory()  # Физическая память
-        swap = psutil.swap_memory()  # Файл подкачки
-        # Суммируем и конвертируем в МБ
-        total_virtual_mb = (memory.total + swap.total) // (1024 * 1024)
-        return total_virtual_mb
-    except (OSError, AttributeError, NotImplementedError):
-        return 0  # Возвращаем 0 при ошибке
+    for partition, (usage, error) in zip(partitions, results):
+        if error is not None:
+            # Если не удалось прочитать диск (например, нет прав доступа)
+            print(f"Error reading drive {partition.device}: {error}")
+            continue  # Переходим к следующему диску
+
+        total_gb = usage.total // GB  # Конвертируем в гигабайты
+        free_gb = usage.free // GB  # Свободное место в ГБ
+
+        # Добавляем информацию о диске в список
+        # partition.device - буква диска (C:\, D:\), partition.fstype - файловая система (NTFS, FAT32)
+        drives.append(Drive(partition.device, partition.fstype, total_gb, free_gb))
+
+    return drives  # Возвращаем список дисков
 
 
 def main():
@@ -171,33 +196,40 @@ def main():
     username = get_username()
     architecture = get_processor_architecture()
 
+    # Запрашиваем состояние памяти у системы один раз и передаем его в функции
+    memory, swap = query_memory()
+
     # Распаковка возвращаемых значений из get_memory_info()
-    total_phys_mb, avail_phys_mb, memory_load = get_memory_info()
+    total_phys_mb, avail_phys_mb, memory_load = get_memory_info(memory)
     used_phys_mb = total_phys_mb - avail_phys_mb  # Расчет используемой памяти
-    pagefile_used, pagefile_total = get_pagefile_info()
+    pagefile_used, pagefile_total = get_pagefile_info(swap)
     processor_count = get_processor_count()
-    virtual_memory_mb = get_virtual_memory_size()
+    # Виртуальная память = физическая память + файл подкачки
+    virtual_memory_mb = total_phys_mb + pagefile_total
     drives = get_drives_info()  # Получаем список дисков
 
-    # Форматированный вывод всей собранной информации
-    print(f"OS: {windows_version}")
-    print(f"Computer Name: {computer_name}")
-    print(f"User: {username}")
-    print(f"Architecture: {architecture}")
-    print(f"RAM: {used_phys_mb}MB / {total_phys_mb}MB")  # Использовано / Всего
-    print(f"Virtual Memory: {virtual_memory_mb}MB")
-    print(f"Memory Load: {memory_load}%")
-    print(f"Pagefile: {pagefile_used}MB / {pagefile_total}MB")  # Использовано / Всего
-
-    print(f"\nProcessors: {processor_count}")
+    # Форматированный вывод всей собранной информации (строки копятся и печатаются одной записью)
+    out = []
+    out.append(f"OS: {windows_version}")
+    out.append(f"Computer Name: {computer_name}")
+    out.append(f"User: {username}")
+    out.append(f"Architecture: {architecture}")
+    out.append(f"RAM: {used_phys_mb}MB / {total_phys_mb}MB")  # Использовано / Всего
+    out.append(f"Virtual Memory: {virtual_memory_mb}MB")
+    out.append(f"Memory Load: {memory_load}%")
+    out.append(f"Pagefile: {pagefile_used}MB / {pagefile_total}MB")  # Использовано / Всего
+
+    out.append(f"\nProcessors: {processor_count}")
     # Вывод информации о дисках
-    print("Drives:")
+    out.append("Drives:")
     if drives:  # Если список дисков не пустой
         for drive in drives:
-            print(
-                f"  - {drive['drive']}  ({drive['fs_type']}): {drive['free_gb']} GB free / {drive['total_gb']} GB total")
+            out.append(
+                f"  - {drive.drive}  ({drive.fs_type}): {drive.free_gb} GB free / {drive.total_gb} GB total")
     else:
-        print("  No drives found")  # Сообщение, если диски не найдены
+        out.append("  No drives found")  # Сообщение, если диски не найдены
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":
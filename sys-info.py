@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import os           # для построения путей к платформенным скриптам
+import runpy        # для загрузки скрипта по пути к файлу
+import sys          # для определения текущей платформы
+
+# Каталог, в котором лежат платформенные скрипты
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Платформа определяется один раз при загрузке модуля: загружается только нужный
+# скрипт, поэтому на Linux не импортируется psutil, а на Windows - модули для /proc
+if sys.platform.startswith('linux'):
+    PLATFORM_SCRIPT = 'sys-info-linux.py'
+elif sys.platform == 'win32':
+    PLATFORM_SCRIPT = 'sys-info-win.py'
+else:
+    PLATFORM_SCRIPT = None
+
+
+def main():
+    """Запуск сбора системной информации для текущей платформы"""
+    if PLATFORM_SCRIPT is None:
+        sys.stderr.write(f"Unsupported platform: {sys.platform}\n")
+        return 1
+
+    # Загружаем скрипт как модуль (без запуска блока __main__) и вызываем его main()
+    namespace = runpy.run_path(os.path.join(SCRIPT_DIR, PLATFORM_SCRIPT))
+    namespace['main']()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())